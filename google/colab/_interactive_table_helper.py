@@ -15,8 +15,33 @@
 
 import html as _html
 import json as _json
+import math as _math
 import numbers as _numbers
 
+# pylint: disable=g-import-not-at-top
+try:
+  # orjson traverses containers in C; prefer it when available.
+  import orjson as _orjson
+except ImportError:
+  _orjson = None
+# pylint: enable=g-import-not-at-top
+
+
+def _dumps(x, default=None):
+  """JSON-encodes x, using orjson when available."""
+  if _orjson is not None:
+    try:
+      # Pass datetimes through to default= so they render via str(), the
+      # same as the stdlib path, rather than as RFC 3339.
+      return _orjson.dumps(
+          x, default=default, option=_orjson.OPT_PASSTHROUGH_DATETIME
+      ).decode()
+    except TypeError:
+      # orjson rejects some inputs stdlib json accepts, e.g. sets, non-str
+      # dict keys, and integers outside 64 bits.
+      pass
+  return _json.dumps(x, default=default)
+
 
 class _CellValue(dict):
   """Encodes cell value dictionary that should be passed to javascript side."""
@@ -122,6 +147,7 @@ def _to_js(
     formatter=None,
     as_string=False,
     html_encode=False,
+    dumps=_dumps,
 ):
   """Formats given x into js-parseable structure.
 
@@ -131,6 +157,7 @@ def _to_js(
     formatter: function-like object that takes x and returns html string.
     as_string: force the value to be a string in the JSON.
     html_encode: escape HTML characters in strings.
+    dumps: JSON serializer to use for the encoded value.
 
   Returns:
     string - the javascript representation
@@ -192,13 +219,23 @@ def _to_js(
   # Ensure that we're returning JSON of a string value.
   double_encode_json = as_string and not isinstance(x, str)
 
+  # orjson serializes non-finite floats as null; route them (including ones
+  # nested in list cells) to stdlib json, which emits the Infinity/NaN
+  # literals the js side has always received.
+  if isinstance(x, float) and not _math.isfinite(x):
+    dumps = _json.dumps
+  elif isinstance(x, list) and any(
+      isinstance(el, float) and not _math.isfinite(el) for el in x
+  ):
+    dumps = _json.dumps
+
   try:
-    result = _json.dumps(x, default=represent_as_string)
+    result = dumps(x, default=represent_as_string)
   except UnicodeDecodeError:
     if isinstance(x, str):
-      result = _json.dumps(default_nonunicode_formatter(x))
+      result = dumps(default_nonunicode_formatter(x))
     else:
-      result = _json.dumps(
+      result = dumps(
           [
               _to_js(el, default_nonunicode_formatter, html_encode=html_encode)
               for el in x
@@ -206,7 +243,7 @@ def _to_js(
       )
   result = result.replace('</', '<\\/')
   if double_encode_json:
-    result = _json.dumps(result)
+    result = dumps(result)
   return result
 
 
@@ -355,41 +392,190 @@ def _num_columns(data):
     return 0
 
 
-def _format_data(data, default_formatter, custom_formatters, html_encode=False):
+def _format_numeric_column(values):
+  """Bulk-formats a numeric numpy column into JSON-encoded cell strings.
+
+  Args:
+    values: 1D numpy array of integer or float dtype.
+
+  Returns:
+    A list of JSON-encoded cell strings, or None if the column contains
+    values that need the per-cell _to_js path (large integers that must be
+    represented as strings, or non-finite floats).
+  """
+  kind = values.dtype.kind
+  if kind in 'iu':
+    # Large integers must be stringified (see _fix_large_ints); leave those
+    # columns to the per-cell path.
+    if values.size and ((values > 2**52) | (values < -(2**52))).any():
+      return None
+    # The numpy str cast renders each element in C, producing valid JSON
+    # number literals for in-range integers.
+    return values.astype('U').tolist()
+  if kind == 'f':
+    # Narrow floats render with their own shortest repr under the str cast,
+    # while the per-cell path widens to float64 first; upcast so both paths
+    # display the same digits.
+    if values.dtype.itemsize != 8:
+      values = values.astype('float64')
+    # We want to avoid proactively importing numpy at kernel startup.
+    import numpy as _np  # pylint: disable=g-import-not-at-top
+
+    if not _np.isfinite(values).all():
+      return None
+    # Integral floats beyond 2**52 get stringified by the per-cell path;
+    # don't fast-path them.
+    if ((values > 2**52) | (values < -(2**52))).any():
+      return None
+    # The str cast matches the per-cell path, which boxes float64 cells into
+    # plain Python floats and renders them via repr (so integral floats emit
+    # '1.0' on both paths).
+    return values.astype('U').tolist()
+  return None
+
+
+def _get_column(data, column_index):
+  """Extracts a single column from a raw data source.
+
+  Args:
+    data: 2D numpy array, 1D record array, or list of lists representing the
+      contents of the source dataframe.
+    column_index: index of the column to extract.
+
+  Returns:
+    An iterable over the column's cells.
+  """
+  if hasattr(data, 'shape'):  # True for numpy arrays
+    if data.ndim == 1:
+      return data[data.dtype.names[column_index]]
+    return data[:, column_index]
+  return [row[column_index] for row in data]
+
+
+def _format_preformatted_columns(preformatted_columns, num_columns):
+  """Assembles formatted data directly from bulk-formatted columns.
+
+  Args:
+    preformatted_columns: dict mapping every column index in
+      range(num_columns) to a list of JSON-encoded cell strings.
+    num_columns: number of columns.
+
+  Returns:
+    The same dict shape as _format_data.
+  """
+  columns = [preformatted_columns[i] for i in range(num_columns)]
+  rows = [',\n'.join(cells) for cells in zip(*columns)]
+  if rows:
+    formatted_data = '[[%s]]' % '],\n ['.join(rows)
+  else:
+    formatted_data = '[]'
+  return {'column_types': ['number'] * num_columns, 'data': formatted_data}
+
+
+def _format_default_column(column, default_formatter, html_encode, dumps):
+  """Formats a column with no custom formatter, short-circuiting nulls.
+
+  Null cells (None/NaN/NaT) are common in displayed frames; encode them as
+  the JSON null sentinel in bulk instead of dispatching _to_js per cell.
+  """
+  # We want to avoid proactively importing pandas at kernel startup.
+  import pandas as _pd  # pylint: disable=g-import-not-at-top
+
+  try:
+    mask = _pd.isna(column)
+  except (TypeError, ValueError):
+    mask = None
+  if mask is None or not mask.any():
+    return [
+        _to_js(cell, default_formatter, html_encode=html_encode, dumps=dumps)
+        for cell in column
+    ]
+  if mask.all():
+    return ['null'] * len(column)
+  return [
+      'null'
+      if isna
+      else _to_js(cell, default_formatter, html_encode=html_encode, dumps=dumps)
+      for cell, isna in zip(column, mask.tolist())
+  ]
+
+
+def _format_data(
+    data,
+    default_formatter,
+    custom_formatters,
+    html_encode=False,
+    preformatted_columns=None,
+    dumps=_dumps,
+):
   """Formats the given data and determines column types."""
-  column_types = [_get_column_type(data, i) for i in range(_num_columns(data))]
-  formatted_values = []
-  for row in data:
-    formatted_row = []
-    for column_index, cell in enumerate(row):
-      custom_formatter = custom_formatters.get(column_index, None)
-      formatted_value = cell
-      if custom_formatter:
-        formatted_value = custom_formatter(formatted_value)
-      column_type = column_types[column_index]
-      if column_type != 'number' or not custom_formatter:
-        formatted_row.append(
-            _to_js(formatted_value, default_formatter, html_encode=html_encode)
-        )
-      else:
+  preformatted_columns = preformatted_columns or {}
+  num_columns = _num_columns(data)
+  num_rows = len(data)
+  column_types = [
+      'number' if i in preformatted_columns else _get_column_type(data, i)
+      for i in range(num_columns)
+  ]
+  has_custom_formatters = bool(custom_formatters)
+  # Format column-at-a-time: each column is formatted in a tight loop over a
+  # contiguous slice rather than bouncing between columns per row.
+  formatted_columns = []
+  for column_index in range(num_columns):
+    preformatted = preformatted_columns.get(column_index)
+    if preformatted is not None:
+      formatted_columns.append(preformatted)
+      continue
+    column = _get_column(data, column_index)
+    custom_formatter = (
+        custom_formatters.get(column_index, None)
+        if has_custom_formatters
+        else None
+    )
+    if not custom_formatter:
+      formatted_columns.append(
+          _format_default_column(
+              column, default_formatter, html_encode=html_encode, dumps=dumps
+          )
+      )
+    elif column_types[column_index] != 'number':
+      formatted_columns.append([
+          _to_js(
+              custom_formatter(cell),
+              default_formatter,
+              html_encode=html_encode,
+              dumps=dumps,
+          )
+          for cell in column
+      ])
+    else:
+      formatted_column = []
+      for cell in column:
         raw_value = _to_js(
-            _get_value(cell), default_formatter, html_encode=html_encode
+            _get_value(cell),
+            default_formatter,
+            html_encode=html_encode,
+            dumps=dumps,
         )
         formatted_value = _to_js(
-            _get_formatted(formatted_value),
+            _get_formatted(custom_formatter(cell)),
             default_formatter,
             as_string=True,
             html_encode=html_encode,
+            dumps=dumps,
         )
-        formatted_row.append(
+        formatted_column.append(
             """{
             'v': %s,
             'f': %s,
         }"""
             % (raw_value, formatted_value)
         )
+      formatted_columns.append(formatted_column)
 
-    formatted_values.append(',\n'.join(formatted_row))
+  if formatted_columns:
+    formatted_values = [',\n'.join(cells) for cells in zip(*formatted_columns)]
+  else:
+    formatted_values = [''] * num_rows
 
   if formatted_values:
     formatted_data = '[[%s]]' % '],\n ['.join(formatted_values)
@@ -13,7 +13,9 @@
 # limitations under the License.
 """Formatter used to display a data table conversion button next to dataframes."""
 
-import uuid as _uuid
+import collections as _collections
+import itertools as _itertools
+import re as _re
 import weakref as _weakref
 from google.colab import data_table as _data_table
 from google.colab import output as _output
@@ -66,11 +68,15 @@ _HINT_BUTTON_CSS = """
   </style>
 """
 
-# Cache of non-interactive dfs that still have live references and could be
-# printed as interactive dfs.
-_noninteractive_df_refs = _weakref.WeakValueDictionary()
+# Cache of weak references to non-interactive dfs that still have live
+# references and could be printed as interactive dfs. Bounded so the cache
+# doesn't grow without limit over a long session of displays.
+_noninteractive_df_refs = _collections.OrderedDict()
+_MAX_NONINTERACTIVE_DF_REFS = 256
 
-# Single entry cache that stores a shallow copy of the last printed df.
+# Single entry cache that stores a weak reference to the last printed df.
+# Conversion reflects the dataframe's state at click time, not display time,
+# matching the tradeoff already made by _noninteractive_df_refs.
 _last_noninteractive_df = {}
 
 
@@ -83,9 +89,13 @@ def _convert_to_interactive(key):
 
 def _get_dataframe(key):
   if key in _last_noninteractive_df:
-    return _last_noninteractive_df.pop(key)
-  elif key in _noninteractive_df_refs:
-    return _noninteractive_df_refs.pop(key)
+    df = _last_noninteractive_df.pop(key)()
+    if df is not None:
+      return df
+  if key in _noninteractive_df_refs:
+    df = _noninteractive_df_refs.pop(key)()
+    if df is not None:
+      return df
   print(
       'Error: Runtime no longer has a reference to this dataframe, please'
       ' re-run this cell and try again.'
@@ -93,34 +103,35 @@ def _get_dataframe(key):
 
 
 def _get_last_dataframe_key():
-  df_keys = list(_last_noninteractive_df.keys())
-  if df_keys:
-    return df_keys[0]
+  # The cache holds at most one entry (see _df_formatter_with_interactive_hint,
+  # which clears it before inserting), so the first key is the only key.
+  return next(iter(_last_noninteractive_df), None)
 
 
-_output_callbacks = {}
+# Keys only need to be unique within the kernel session, so a monotonic
+# counter is sufficient and avoids a urandom read per display.
+_counter = _itertools.count()
 
 
 def _df_formatter_with_interactive_hint(dataframe):
   """Alternate df formatter that includes a button to convert to interactive."""
-  key = 'df-' + str(_uuid.uuid4())
-  _noninteractive_df_refs[key] = dataframe
+  key = f'df-{next(_counter)}-{id(dataframe):x}'
+  _noninteractive_df_refs[key] = _weakref.ref(dataframe)
+  while len(_noninteractive_df_refs) > _MAX_NONINTERACTIVE_DF_REFS:
+    _noninteractive_df_refs.popitem(last=False)
 
   # Ensure our last value cache only contains one item.
   _last_noninteractive_df.clear()
-  _last_noninteractive_df[key] = dataframe.copy(deep=False)
+  _last_noninteractive_df[key] = _weakref.ref(dataframe)
 
-  convert_func = 'convertToInteractive'
-  if convert_func not in _output_callbacks:
-    _output_callbacks[convert_func] = _output.register_callback(
-        convert_func, _convert_to_interactive
-    )
-  return _get_html(dataframe, key)
+  return _get_html(dataframe._repr_html_(), key)  # pylint: disable=protected-access
 
 
-def _get_html(dataframe, key):
-  # pylint: disable=protected-access
-  return """
+# The {css}, {icon} and {data_table_url} slots are constants, so they are
+# bound once at import time; only {key} and {df_html} vary per display. Note
+# the CSS contains literal braces, so the prebound template cannot go through
+# str.format a second time.
+_HTML_TEMPLATE = """
   <div id="{key}">
     <div class="colab-df-container">
       {df_html}
@@ -157,12 +168,21 @@ def _get_html(dataframe, key):
     </div>
   </div>
   """.format(
-      css=_HINT_BUTTON_CSS,
-      data_table_url=_data_table._DATA_TABLE_HELP_URL,
-      df_html=dataframe._repr_html_(),
-      icon=_ICON_SVG,
-      key=key,
-  )
+    css=_HINT_BUTTON_CSS,
+    data_table_url=_data_table._DATA_TABLE_HELP_URL,
+    icon=_ICON_SVG,
+    key='{key}',
+    df_html='{df_html}',
+)
+
+# Split the template at its slots once so each display is a single join with
+# no per-call template scanning.
+_HTML_TEMPLATE_PARTS = _re.split(r'({key}|{df_html})', _HTML_TEMPLATE)
+
+
+def _get_html(df_html, key):
+  values = {'{key}': key, '{df_html}': df_html}
+  return ''.join(values.get(part, part) for part in _HTML_TEMPLATE_PARTS)
 
 
 _original_formatters = {}
@@ -175,6 +195,7 @@ def _enable_df_interactive_hint_formatter():
     return
   key = 'text/html'
   if key not in _original_formatters:
+    _output.register_callback('convertToInteractive', _convert_to_interactive)
     formatters = shell.display_formatter.formatters
     _original_formatters[key] = formatters[key].for_type_by_name(
         'pandas.core.frame', 'DataFrame', _df_formatter_with_interactive_hint
@@ -27,7 +27,6 @@ import traceback as _traceback
 import warnings as _warnings
 
 from google.colab import _interactive_table_helper
-from google.colab import _quickchart_hint_button
 import IPython as _IPython
 from IPython import display as _display
 
@@ -61,13 +60,26 @@ _JAVASCRIPT_MODULE_MIME_TYPE = (
 
 _FAKE_DATAFRAME_COLUMN = '__fake_dataframe_column__'
 
+# Frames smaller than this many cells render faster as plain pandas HTML than
+# as an interactive table (whose js bundle load dominates), so the automatic
+# formatter leaves them to pandas. Explicitly constructed DataTables are
+# always interactive.
+_MIN_CELLS_FOR_INTERACTIVE = 200
 
-def _force_to_latin1(x):
-  return f'nonunicode data: {_html.escape(x[:100].decode("latin1"))}...'
 
+def _format_nonunicode(x):
+  if isinstance(x, bytes):
+    x = x.decode('utf-8', 'replace')
+  return f'nonunicode data: {_html.escape(x[:100])}...'
 
-_DEFAULT_NONUNICODE_FORMATTER = _force_to_latin1
+
+_DEFAULT_NONUNICODE_FORMATTER = _format_nonunicode
 _DEFAULT_FORMATTERS = {str: str}
+# _DEFAULT_FORMATTERS is a module-level constant, so build the dispatching
+# formatter once rather than on every _gen_js call.
+_DEFAULT_COLUMN_FORMATTER = _interactive_table_helper._find_formatter(  # pylint: disable=protected-access
+    _DEFAULT_FORMATTERS
+)
 _DEFAULT_SUPPRESS_OUTPUT_SCROLLING = True
 
 
@@ -101,6 +113,10 @@ class DataTable(_display.DisplayObject):
       return None
     if isinstance(dataframe.index, _pd.MultiIndex):
       return None
+    # For tiny dataframes, the pandas repr is faster and the user can still
+    # convert to an interactive table via the hint button.
+    if dataframe.shape[0] * dataframe.shape[1] < _MIN_CELLS_FOR_INTERACTIVE:
+      return None
     # For large dataframes, fall back to pandas rather than truncating.
     if dataframe.shape[0] > cls.max_rows:
       print(
@@ -169,7 +185,12 @@ class DataTable(_display.DisplayObject):
           'Limiting to first (%d) rows.'
           % (len(self._dataframe), self._max_rows, self._max_rows)
       )
-    dataframe = self._dataframe.iloc[: self._max_rows, : self._max_columns]
+    dataframe = self._dataframe
+    if (
+        len(dataframe) > self._max_rows
+        or len(dataframe.columns) > self._max_columns
+    ):
+      dataframe = dataframe.iloc[: self._max_rows, : self._max_columns]
 
     if self._include_index or dataframe.shape[1] == 0:
       dataframe = dataframe.reset_index()
@@ -178,17 +199,37 @@ class DataTable(_display.DisplayObject):
     # (see b/140769413 for details)
     for i, dtype in enumerate(dataframe.dtypes):
       if dtype == 'uint64' and (dataframe.iloc[:, i] > 2**63).any():
-        dataframe.iloc[:, i] = dataframe.iloc[:, i].astype(object)
+        if dataframe is self._dataframe:
+          # Don't mutate the user's frame when no slice/reset copied it.
+          dataframe = dataframe.copy(deep=False)
+        dataframe.isetitem(i, dataframe.iloc[:, i].astype(object))
     return dataframe
 
   def _repr_mimebundle_(self, include=None, exclude=None):
-    mime_bundle = {'text/html': self._repr_html_()}
-    try:
-      dataframe = self._preprocess_dataframe()
-      mime_bundle[_JAVASCRIPT_MODULE_MIME_TYPE] = self._gen_js(dataframe)
-    except:  # pylint: disable=bare-except
-      # need to catch and print exception since it is user visible
-      _traceback.print_exc()
+    include = include or {'text/html', _JAVASCRIPT_MODULE_MIME_TYPE}
+    exclude = exclude or set()
+    mime_bundle = {}
+    if (
+        _JAVASCRIPT_MODULE_MIME_TYPE in include
+        and _JAVASCRIPT_MODULE_MIME_TYPE not in exclude
+    ):
+      try:
+        dataframe = self._preprocess_dataframe()
+        mime_bundle[_JAVASCRIPT_MODULE_MIME_TYPE] = self._gen_js(dataframe)
+      except:  # pylint: disable=bare-except
+        # need to catch and print exception since it is user visible
+        _traceback.print_exc()
+    if 'text/html' in include and 'text/html' not in exclude:
+      if _JAVASCRIPT_MODULE_MIME_TYPE in mime_bundle:
+        # The js module repr takes precedence in the frontend, so avoid paying
+        # for a second full serialization of the dataframe.
+        rows, cols = self._dataframe.shape
+        mime_bundle['text/html'] = (
+            f'<div>Interactive table ({rows} rows \N{MULTIPLICATION SIGN}'
+            f' {cols} columns)</div>'
+        )
+      else:
+        mime_bundle['text/html'] = self._repr_html_()
     return mime_bundle
 
   def _repr_html_(self):
@@ -202,6 +243,10 @@ class DataTable(_display.DisplayObject):
       _traceback.print_exc()
 
   def _get_dataframe_values(self, df):
+    if df is self._dataframe:
+      # Don't insert/delete the fake column on the user's frame when
+      # _preprocess_dataframe returned it untouched.
+      df = df.copy(deep=False)
     df.insert(df.shape[1], _FAKE_DATAFRAME_COLUMN, [None] * df.shape[0])
     try:
       values = df.to_numpy(dtype=object)[:, :-1]
@@ -211,27 +256,48 @@ class DataTable(_display.DisplayObject):
 
   def _gen_js(self, dataframe):
     """Returns javascript for this table."""
-    columns = dataframe.columns
-    data = self._get_dataframe_values(dataframe)
+    # We want to avoid proactively importing numpy (via _quickchart) at
+    # kernel startup.
+    from google.colab import _quickchart_hint_button  # pylint: disable=g-import-not-at-top
 
-    data_formatters = {}
-    header_formatters = {}
-    default_formatter = _interactive_table_helper._find_formatter(  # pylint: disable=protected-access
-        _DEFAULT_FORMATTERS
-    )
-
-    for i, _ in enumerate(columns):
-      data_formatters[i] = default_formatter
-      header_formatters[i] = default_formatter
+    columns = dataframe.columns
 
-    formatted_data = _interactive_table_helper._format_data(  # pylint: disable=protected-access
-        data, _DEFAULT_NONUNICODE_FORMATTER, data_formatters
-    )
+    # Numeric columns can be JSON-encoded in bulk by numpy instead of
+    # dispatching _to_js once per cell; this covers most cells of typical
+    # data-science frames.
+    preformatted_columns = {}
+    for i, dtype in enumerate(dataframe.dtypes):
+      if getattr(dtype, 'kind', None) in ('i', 'u', 'f'):
+        formatted = _interactive_table_helper._format_numeric_column(  # pylint: disable=protected-access
+            dataframe.iloc[:, i].to_numpy()
+        )
+        if formatted is not None:
+          preformatted_columns[i] = formatted
+
+    if len(preformatted_columns) == len(columns):
+      # All-numeric frame: assemble the output from the bulk-formatted
+      # columns directly, skipping the object-dtype matrix that
+      # _get_dataframe_values would box every cell into.
+      formatted_data = _interactive_table_helper._format_preformatted_columns(  # pylint: disable=protected-access
+          preformatted_columns, len(columns)
+      )
+    else:
+      data = self._get_dataframe_values(dataframe)
+      # All columns share the default formatter, so no per-column overrides
+      # are needed.
+      formatted_data = _interactive_table_helper._format_data(  # pylint: disable=protected-access
+          data,
+          _DEFAULT_NONUNICODE_FORMATTER,
+          {},
+          preformatted_columns=preformatted_columns,
+      )
     column_types = formatted_data['column_types']
 
     columns_and_types = []
-    for i, (column_type, column) in enumerate(zip(column_types, columns)):
-      columns_and_types.append((column_type, str(header_formatters[i](column))))
+    for column_type, column in zip(column_types, columns):
+      columns_and_types.append(
+          (column_type, str(_DEFAULT_COLUMN_FORMATTER(column)))
+      )
 
     column_options = []
     if self._include_index:
@@ -269,8 +335,8 @@ class DataTable(_display.DisplayObject):
     """.format(
         gviz_url=_GVIZ_JS,
         data=formatted_data['data'],
-        columns=_json.dumps(columns_and_types),
-        column_options=_json.dumps(column_options),
+        columns=_interactive_table_helper._dumps(columns_and_types),  # pylint: disable=protected-access
+        column_options=_interactive_table_helper._dumps(column_options),  # pylint: disable=protected-access
         num_rows_per_page=self._num_rows_per_page,
         help_url=_DATA_TABLE_HELP_URL,
         suppress_output_scrolling=_json.dumps(
@@ -51,6 +51,26 @@ class DataTableTest(unittest.TestCase):
       for val in df[col]:
         self.assertIn('{}'.format(val), html)
 
+  def testDataTableJavascriptContainsValues(self):
+    df = pd.DataFrame(
+        {'x': [1, 2, 3], 'y': [0.5, 1.5, 2.25], 'z': ['ab', 'cd', 'ef']}
+    )
+
+    dt = data_table.DataTable(df, include_index=False)
+    js = dt._repr_javascript_module_()
+    for col in df.columns:
+      for val in df[col]:
+        self.assertIn('{}'.format(val), js)
+
+  def testDataTableWithDuplicateColumns(self):
+    df = pd.DataFrame([[1, 'a'], [2, 'b']], columns=['x', 'x'])
+
+    dt = data_table.DataTable(df, include_index=False)
+    js = dt._repr_javascript_module_()
+    # Column payload separators depend on the JSON serializer in use.
+    self.assertRegex(js, r'\["number",\s*"x"\]')
+    self.assertRegex(js, r'\["string",\s*"x"\]')
+
   def testFormatterEnableDisable(self):
     def get_formatter():
       key = data_table._JAVASCRIPT_MODULE_MIME_TYPE